@@ -1,7 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from orjson import dumps
+from sys import intern
 from typing import Any
 
 from utils.cleaning import clean_string
@@ -27,7 +28,7 @@ class BSP:
     ip_vol: str | None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     def to_json(self) -> str:
         return dumps(self.to_dict()).decode('utf-8')
@@ -36,9 +37,9 @@ class BSP:
     def from_csv(cls, record: dict[str, str]) -> BSP | None:
         try:
             return cls(
-                date=record['date'],
+                date=intern(record['date']),
                 region=record['region'],
-                off=record['off'],
+                off=intern(record['off']),
                 horse=record['horse'],
                 bsp=record.get('bsp') or None,
                 wap=record.get('wap') or None,
@@ -69,13 +70,13 @@ class BSP:
         horse = clean_name(record.get('selection_name', ''), region_val)
 
         return cls(
-            date=dt,
+            date=intern(dt),
             region=region_val,
-            off=off,
+            off=intern(off),
             horse=horse.lower(),
-            bsp=f'{float(record["bsp"]):.2f}' if record.get('bsp') else None,
-            wap=f'{float(record["ppwap"]):.2f}' if record.get('ppwap') else None,
-            morning_wap=f'{float(record["morningwap"]):.2f}' if record.get('morningwap') else None,
+            bsp=format_price(record.get('bsp')),
+            wap=format_price(record.get('ppwap')),
+            morning_wap=format_price(record.get('morningwap')),
             pre_max=record.get('ppmax'),
             pre_min=record.get('ppmin'),
             ip_max=record.get('ipmax'),
@@ -98,6 +99,10 @@ def clean_name(name: str, region: str) -> str:
     return cleaned
 
 
+def format_price(price: str | None) -> str | None:
+    return f'{float(price):.2f}' if price else None
+
+
 def parse_date_time(s: str) -> tuple[str, str] | None:
     if not s:
         return None
@@ -12,7 +12,7 @@ from dotenv import load_dotenv
 from functools import partial
 from lxml import etree, html
 from pathlib import Path
-from orjson import dumps
+from orjson import dumps, loads
 from tqdm import tqdm
 from typing import Any
 
@@ -189,7 +189,7 @@ def parse_runners(
             runner.name = clean_string(runner_json['horseName'])
             runner.horse_id = runner_json['horseUid']
             runner.number = runner_json['startNumber']
-            runner.draw = runner_json['draw'] if runner_json['draw'] else None
+            runner.draw = runner_json['draw'] or None
 
         # Basic info
         if should_include_group('basic_info'):
@@ -208,11 +208,9 @@ def parse_runners(
                 if runner_json['figuresCalculated']
                 else ''
             )
-            runner.rpr = runner_json['rpPostmark'] if runner_json['rpPostmark'] else None
-            runner.ts = runner_json['rpTopspeed'] if runner_json['rpTopspeed'] else None
-            runner.ofr = (
-                runner_json['officialRatingToday'] if runner_json['officialRatingToday'] else None
-            )
+            runner.rpr = runner_json['rpPostmark'] or None
+            runner.ts = runner_json['rpTopspeed'] or None
+            runner.ofr = runner_json['officialRatingToday'] or None
             runner.last_run = runner_json['daysSinceLastRun']
 
         # Jockey fields
@@ -413,7 +411,7 @@ def scrape_racecards(
                 doc_accordion = None
 
         try:
-            runners_map = resp_runners.json()['runners']
+            runners_map = loads(resp_runners.content)['runners']
             runners = list(runners_map.values())
             race_meta = runners[0]
         except (KeyError, IndexError, ValueError):
@@ -545,8 +543,8 @@ def main() -> None:
     for date in race_urls:
         racecards = scrape_racecards(race_urls, date, config, client)
 
-        with open(f'../racecards/{date}.json', 'w', encoding='utf-8') as f:
-            _ = f.write(dumps(racecards).decode('utf-8'))
+        with open(f'../racecards/{date}.json', 'wb') as f:
+            _ = f.write(dumps(racecards))
 
 
 if __name__ == '__main__':
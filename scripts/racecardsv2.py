@@ -48,11 +48,13 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from orjson import dumps
+    from orjson import dumps, loads
 except ImportError:
     def dumps(obj):
         return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
+    loads = json.loads
+
 
 # ─── Try importing rpscrape utils (graceful fallback if unavailable) ─────
 
@@ -99,6 +101,11 @@ RACE_TYPE_MAP = {
 }
 DEFAULT_RACE_TYPE = 'Flat'
 
+SEX_NAMES = {
+    'c': 'Colt', 'f': 'Filly', 'g': 'Gelding',
+    'm': 'Mare', 'h': 'Horse', 'r': 'Ridgling',
+}
+
 PRIORITY_TRACKS = {
     'meydan', 'sha tin', 'happy valley',
 }
@@ -111,11 +118,15 @@ type Racecards = defaultdict[str, defaultdict[str, defaultdict[str, dict[str, An
 
 # ─── Network ────────────────────────────────────────────────────────────
 
+# One session for the whole run so the connection to RP is kept alive
+session = requests.Session(impersonate='chrome')
+
+
 def fetch_page(url: str, retries: int = MAX_RETRIES) -> str | None:
     """Fetch page with Chrome impersonation and retry on transient errors."""
     for attempt in range(retries):
         try:
-            resp = requests.get(url, impersonate='chrome', timeout=30)
+            resp = session.get(url, timeout=30)
             if resp.status_code == 200:
                 return resp.text
             if resp.status_code in (406, 429, 503):
@@ -143,7 +154,7 @@ def extract_next_data(page_html: str) -> dict | None:
     )
     if match:
         try:
-            return json.loads(match.group(1))
+            return loads(match.group(1))
         except json.JSONDecodeError as e:
             print(f'  ⚠️  __NEXT_DATA__ JSON parse error: {e}')
     return None
@@ -181,9 +192,7 @@ def parse_color_sex(color_sex: str | None) -> tuple[str, str, str]:
         return (color_sex.strip(), '', '')
     colour = ' '.join(parts[:-1])
     code = parts[-1]
-    names = {'c': 'Colt', 'f': 'Filly', 'g': 'Gelding',
-             'm': 'Mare', 'h': 'Horse', 'r': 'Ridgling'}
-    return (colour, names.get(code.lower(), code), code)
+    return (colour, SEX_NAMES.get(code.lower(), code), code)
 
 
 def parse_form(form_data: list[dict] | None) -> str:
@@ -195,7 +204,7 @@ def parse_form(form_data: list[dict] | None) -> str:
 
 def num(value) -> int | None:
     """Convert RP rating that can be '-' / int / None → int | None."""
-    if value is None or value == '-' or value == '':
+    if value in (None, '-', ''):
         return None
     try:
         return int(value)
@@ -394,7 +403,7 @@ def map_runner(r: dict) -> dict:
         'damsire_id': parse_id_from_url(r.get('damsireUrl')),
         'damsire_region': r.get('damsireCountry'),
         'dob': None,
-        'draw': r.get('draw') if r.get('draw') else None,
+        'draw': r.get('draw') or None,
         'form': form,
         'gelding_first_time': r.get('geldingFirstTime', False),
         'headgear': r.get('horseHeadGear'),
@@ -587,8 +596,8 @@ def main() -> None:
         total_skipped.extend(skipped)
 
         out_path = os.path.join(out_dir, f'{target_date}.json')
-        with open(out_path, 'w', encoding='utf-8') as f:
-            _ = f.write(dumps(racecards).decode('utf-8'))
+        with open(out_path, 'wb') as f:
+            _ = f.write(dumps(racecards))
 
         n = sum(len(ts) for rr in racecards.values() for ts in rr.values())
         print(f'  ✅ Wrote {n} races → {out_path}')
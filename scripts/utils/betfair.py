@@ -1,30 +1,54 @@
 import csv
+import io
+import random
+import threading
 import time
 import curl_cffi
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date, timedelta, datetime
 
 from models.betfair import BSP, BSPMap
 
 
+MAX_WORKERS = 6
+
+RETRIES = 4
+RETRY_DELAY = 10.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES = {429, 502, 503, 504, 520}
+
+_local = threading.local()
+
+
 class Betfair:
     def __init__(self, race_urls: list[str]):
         self.urls: list[tuple[str, str]] = create_urls(race_urls)
         self.data: BSPMap = {}
         self.rows: list[BSP] = []
 
-        for url, region in self.urls:
-            rows = get_data(url, region)
+        sessions: list[curl_cffi.Session] = []
+        executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, initializer=init_session, initargs=(sessions,)
+        )
 
-            if not rows:
-                continue
+        try:
+            for rows in executor.map(get_data, *zip(*self.urls)):
+                if not rows:
+                    continue
+
+                self.rows.extend(rows)
 
-            self.rows.extend(rows)
+                for row in rows:
+                    key = (row.region, row.date, row.off)
+                    self.data.setdefault(key, []).append(row)
+        finally:
+            # on failure, drop queued downloads and wait only for in-flight ones
+            executor.shutdown(cancel_futures=True)
 
-            for row in rows:
-                key = (row.region, row.date, row.off)
-                self.data.setdefault(key, []).append(row)
+            for session in sessions:
+                session.close()
 
     @classmethod
     def from_csv(cls, path: Path) -> 'Betfair':
@@ -50,17 +74,16 @@ class Betfair:
         return self
 
 
+def backoff(attempt: int) -> float:
+    delay = min(RETRY_DELAY * 2**attempt, RETRY_MAX_DELAY)
+    return delay + random.uniform(0, RETRY_DELAY)
+
+
 def create_date_range(date_start: str, date_end: str) -> list[date]:
     start = datetime.strptime(date_start, '%Y-%m-%d').date() - timedelta(days=1)
     end = datetime.strptime(date_end, '%Y-%m-%d').date() + timedelta(days=1)
 
-    dates: list[date] = []
-    current = start
-    while current <= end:
-        dates.append(current)
-        current += timedelta(days=1)
-
-    return dates
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
 
 
 def create_urls(race_urls: list[str]) -> list[tuple[str, str]]:
@@ -81,19 +104,31 @@ def create_urls(race_urls: list[str]) -> list[tuple[str, str]]:
     return urls
 
 
+def init_session(sessions: list[curl_cffi.Session]) -> None:
+    session = curl_cffi.Session()
+    _local.session = session
+    sessions.append(session)
+
+
 def get_data(url: str, region: str) -> list[BSP] | None:
-    resp = curl_cffi.get(url)
+    session: curl_cffi.Session | None = getattr(_local, 'session', None)
+
+    if session is None:
+        with curl_cffi.Session() as session:
+            return fetch_data(session, url, region)
 
-    for _ in range(4):
+    return fetch_data(session, url, region)
+
+
+def fetch_data(session: curl_cffi.Session, url: str, region: str) -> list[BSP] | None:
+    resp = session.get(url)
+
+    for attempt in range(RETRIES):
         if resp.status_code == 404:
             return None
-        if resp.status_code == 429:
-            time.sleep(10)
-            resp = curl_cffi.get(url)
-            continue
-        if resp.status_code == 520:
-            time.sleep(10)
-            resp = curl_cffi.get(url)
+        if resp.status_code in RETRY_STATUSES:
+            time.sleep(backoff(attempt))
+            resp = session.get(url)
             continue
         if resp.status_code == 200:
             break
@@ -102,7 +137,9 @@ def get_data(url: str, region: str) -> list[BSP] | None:
     if resp.status_code != 200:
         raise RuntimeError(f'HTTP error {resp.status_code} for URL {url}')
 
-    reader = csv.DictReader(resp.content.decode().splitlines())
+    reader = csv.DictReader(
+        io.TextIOWrapper(io.BytesIO(resp.content), encoding='utf-8', newline='')
+    )
     rows: list[BSP] = []
 
     for record in reader:
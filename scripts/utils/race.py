@@ -1,6 +1,8 @@
 import sys
 
+from dataclasses import fields as dataclass_fields
 from datetime import datetime
+from functools import cache
 from jarowinkler import jarowinkler_similarity
 from lxml import html
 from lxml.html import HtmlElement
@@ -22,6 +24,28 @@ from utils.region import get_region
 regex_class = r'(\(|\s)(C|c)lass (\d|[A-Ha-h])(\)|\s)'
 regex_group = r'(\(|\s)((G|g)rade|(G|g)roup) (\d|[A-Ca-c]|I*)(\)|\s)'
 
+RACE_CLASSES = {
+    'a': '1',
+    'b': '2',
+    'c': '3',
+    'd': '4',
+    'e': '5',
+    'f': '6',
+    'g': '6',
+    'h': '7',
+}
+
+SEX_RESTRICTIONS = (
+    (('entire colts & fillies', 'colts & fillies'), 'C & F'),
+    (('fillies & mares', 'filles & mares'), 'F & M'),
+    (('colts & geldings', 'colts/geldings', '(c & g)'), 'C & G'),
+    (('(mares & geldings)',), 'M & G'),
+    (('fillies',), 'F'),
+    (('mares',), 'M'),
+)
+
+FIELD_MAPPING = {'type': 'race_type', 'class': 'race_class', 'or': 'ofr'}
+
 
 class VoidRaceError(Exception):
     pass
@@ -171,24 +195,15 @@ class Race:
                 self.runner_info.btn[i] = '-'
 
     def create_csv_data(self, fields: list[str]) -> list[str]:
-        field_mapping = {'type': 'race_type', 'class': 'race_class', 'or': 'ofr'}
-
-        race_values: list[str] = []
-        runner_values: list[list[str]] = []
+        race_fields, runner_fields = split_fields(tuple(fields))
 
-        for field in fields:
-            actual_field = field_mapping.get(field, field)
-
-            if hasattr(self.race_info, actual_field):
-                race_values.append(str(getattr(self.race_info, actual_field)))
-            elif hasattr(self.runner_info, actual_field):
-                runner_values.append([str(v) for v in getattr(self.runner_info, actual_field)])
+        race_values = [str(getattr(self.race_info, field)) for field in race_fields]
+        runner_values = [
+            [str(v) for v in getattr(self.runner_info, field)] for field in runner_fields
+        ]
 
-        race_prefix = ','.join(race_values)
-        rows: list[str] = []
-        for row in zip(*runner_values, strict=False):
-            rows.append(race_prefix + ',' + ','.join(row) if race_prefix else ','.join(row))
-        return rows
+        race_prefix = ','.join(race_values) + ',' if race_values else ''
+        return [race_prefix + ','.join(row) for row in zip(*runner_values, strict=False)]
 
     def get_comments(self):
         def clean_comment(x: str):
@@ -233,10 +248,10 @@ class Race:
         num_runners: int = len(self.runner_info.pos)
 
         if len(ovr_btn) < num_runners:
-            ovr_btn.extend('' for _ in range(num_runners - len(ovr_btn)))
+            ovr_btn.extend([''] * (num_runners - len(ovr_btn)))
 
         if len(btn) < num_runners:
-            btn.extend('' for _ in range(num_runners - len(btn)))
+            btn.extend([''] * (num_runners - len(btn)))
 
         return ovr_btn, btn
 
@@ -362,23 +377,12 @@ class Race:
         return ['' if p == 'DSQ' else prize for p, prize in zip(positions, prizes)]
 
     def get_race_class(self) -> str:
-        classes = {
-            'a': '1',
-            'b': '2',
-            'c': '3',
-            'd': '4',
-            'e': '5',
-            'f': '6',
-            'g': '6',
-            'h': '7',
-        }
-
         match = search(regex_class, self.race_info.race_name)
 
         if match:
             race_class = match.groups()[2].lower()
-            if race_class in classes:
-                return 'Class ' + classes[race_class]
+            if race_class in RACE_CLASSES:
+                return 'Class ' + RACE_CLASSES[race_class]
             return 'Class ' + race_class
 
         if '(premier handicap)' in self.race_info.race_name:
@@ -594,16 +598,7 @@ class Race:
     def sex_restricted(self) -> str:
         race_name = self.race_info.race_name.lower()
 
-        patterns = [
-            (['entire colts & fillies', 'colts & fillies'], 'C & F'),
-            (['fillies & mares', 'filles & mares'], 'F & M'),
-            (['colts & geldings', 'colts/geldings', '(c & g)'], 'C & G'),
-            (['(mares & geldings)'], 'M & G'),
-            (['fillies'], 'F'),
-            (['mares'], 'M'),
-        ]
-
-        for terms, result in patterns:
+        for terms, result in SEX_RESTRICTIONS:
             if any(term in race_name for term in terms):
                 return result
 
@@ -623,6 +618,25 @@ class Race:
         return [convert_time(t) for t in times]
 
 
+@cache
+def split_fields(fields: tuple[str, ...]) -> tuple[list[str], list[str]]:
+    race_attrs = {f.name for f in dataclass_fields(RaceInfo)}
+    runner_attrs = {f.name for f in dataclass_fields(RunnerInfo)}
+
+    race_fields: list[str] = []
+    runner_fields: list[str] = []
+
+    for field in fields:
+        actual_field = FIELD_MAPPING.get(field, field)
+
+        if actual_field in race_attrs:
+            race_fields.append(actual_field)
+        elif actual_field in runner_attrs:
+            runner_fields.append(actual_field)
+
+    return race_fields, runner_fields
+
+
 def distance_to_decimal(dist: str):
     return (
         dist.strip()
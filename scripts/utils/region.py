@@ -3,16 +3,24 @@ from orjson import loads
 _regions = loads(open('../courses/_regions', 'r').read())
 
 
-def get_region(course_id: str) -> str:
+def _load_course_regions() -> dict[str, str]:
     courses = loads(open('../courses/_courses', 'r').read())
     courses.pop('all')
 
+    course_regions: dict[str, str] = {}
+
     for region, course in courses.items():
         for _id in course.keys():
-            if _id == course_id:
-                return region.upper()
+            _ = course_regions.setdefault(_id, region.upper())
+
+    return course_regions
+
 
-    return ''
+_course_regions = _load_course_regions()
+
+
+def get_region(course_id: str) -> str:
+    return _course_regions.get(course_id, '')
 
 
 def print_region(code: str, region: str):
@@ -15,10 +15,10 @@ class Update:
         ).strip()
 
     def remote_hash(self) -> str:
-        resp = get(self.api_url, headers={'User-Agent': 'update-check'})
+        headers = {'User-Agent': 'update-check', 'Accept': 'application/vnd.github.sha'}
+        resp = get(self.api_url, headers=headers)
         resp.raise_for_status()
-        data = resp.json()
-        return data['sha']
+        return resp.text.strip()
 
     def available(self) -> bool:
         return self.local_hash() != self.remote_hash()